@@ -12,20 +12,36 @@ Designed for non-native speakers to:
 """
 
 import streamlit as st
-import pandas as pd
 import json
 import os
+from operator import itemgetter
+from typing import Callable, Dict, Tuple
 
-# Import utilities
-from utils.corpus_lookup import (
-    CorpusLookup, 
-    TYPE_NAMES, 
-    TYPE_EXPLANATIONS,
-    get_type_name,
-    get_type_explanation
-)
+# Import utilities (pandas, the corpus data and jieba are imported inside the
+# functions that need them, so the Home page renders without loading them)
 from utils.construction_info import CONSTRUCTION_TYPES, COMPARISON_TABLE, KEY_DISTINCTIONS
-from utils.predicate_extractor import extract_dui_parts, guess_y_animacy
+
+# Card fields per type: (colour, emoji, full_name, chinese_name, short_description)
+CARD_META: Dict[str, Tuple[str, str, str, str, str]] = {
+    code: (
+        info.get('colour', '#808080'),
+        info.get('emoji', ''),
+        info.get('full_name', code),
+        info.get('chinese_name', ''),
+        info.get('short_description', ''),
+    )
+    for code, info in CONSTRUCTION_TYPES.items()
+}
+
+
+def get_card_meta(code: str) -> Tuple[str, str, str, str, str]:
+    """Get the card fields for a type code (neutral defaults if unknown)."""
+    return CARD_META.get(code) or ('#808080', '', code, '', '')
+
+
+# Card order on the Home and Statistics pages, paired with each type's card fields
+HOME_ORDER = tuple((code, get_card_meta(code)) for code in ('DA', 'SI', 'MS', 'ABT', 'EVAL', 'DISP'))
+STATS_ORDER = tuple((code, get_card_meta(code)) for code in ('DA', 'MS', 'SI', 'EVAL', 'ABT', 'DISP'))
 
 # Page configuration
 st.set_page_config(
@@ -36,7 +52,7 @@ st.set_page_config(
 )
 
 # Custom CSS
-st.markdown("""
+CUSTOM_CSS = """
 <style>
     .type-card {
         padding: 15px;
@@ -58,30 +74,129 @@ st.markdown("""
         margin: 10px 0;
     }
 </style>
-""", unsafe_allow_html=True)
+"""
+
+# Example sentences (with their expected type) for the Analyse page
+EXAMPLES: Tuple[Tuple[str, str], ...] = (
+    ("专家对此发表意见", "ABT"),
+    ("他对我说了几句话", "DA"),
+    ("政府对企业进行检查", "SI"),
+    ("我对这件事很担心", "MS"),
+    ("她对客人很热情", "DISP"),
+    ("运动对健康有益", "EVAL"),
+)
+
+# Shortcut buttons on the Look Up Predicate page
+COMMON_PREDICATES: Tuple[str, ...] = (
+    '说', '进行', '有', '发表', '担心', '热情', '重要', '负责', '了解', '表示',
+)
+
+
+@st.cache_resource
+def inject_css():
+    """Inject the custom CSS (string built once; cache hits replay the element)."""
+    st.markdown(CUSTOM_CSS, unsafe_allow_html=True)
 
 
 @st.cache_resource
 def get_corpus_lookup():
     """Get cached corpus lookup instance."""
+    from utils.corpus_lookup import CorpusLookup
     return CorpusLookup()
 
 
+# The st.cache_data helpers below fetch the shared CorpusLookup through
+# get_corpus_lookup() rather than taking it as an argument: cache_data hashes
+# its arguments on every call, and hashing the lookup means hashing the whole
+# corpus. If a helper must take it as a parameter, name it `_lookup` so
+# Streamlit skips it when building the cache key.
+@st.cache_data(max_entries=512, show_spinner=False)
+def get_sentence_analysis(sentence: str) -> dict:
+    """Get cached parts, contextual analysis and chart items for a sentence."""
+    from utils.corpus_lookup import TYPE_NAMES
+    from utils.predicate_extractor import extract_dui_parts
+    
+    parts = extract_dui_parts(sentence)
+    analysis = get_corpus_lookup().analyse_in_context(
+        parts.get('predicate', ''),
+        complement=parts.get('after_predicate', ''),
+        y_phrase=parts.get('y_phrase', ''),
+        full_sentence=sentence
+    )
+    
+    # Non-zero types by descending share, ready for get_bar_spec
+    dist = (analysis.get('corpus_data') or {}).get('distribution', {})
+    chart_items = tuple(
+        (TYPE_NAMES.get(type_code, (type_code, ''))[0], pct)
+        for type_code, pct in sorted(dist.items(), key=itemgetter(1), reverse=True)
+        if pct > 0
+    )
+    return {'parts': parts, 'analysis': analysis, 'chart_items': chart_items}
+
+
+@st.cache_data(max_entries=256, show_spinner=False)
+def get_bar_spec(items: Tuple[Tuple[str, float], ...]) -> dict:
+    """Get a Vega-Lite bar chart spec for (type name, percentage) pairs, in the given order."""
+    return {
+        'data': {'values': [{'Type': name, 'Percentage': pct} for name, pct in items]},
+        'mark': {'type': 'bar'},
+        'encoding': {
+            'x': {'field': 'Type', 'type': 'ordinal', 'sort': None, 'title': '',
+                  'axis': {'grid': False}},
+            'y': {'field': 'Percentage', 'type': 'quantitative', 'title': '',
+                  'axis': {'grid': True}},
+            'tooltip': [
+                {'field': 'Type', 'type': 'nominal'},
+                {'field': 'Percentage', 'type': 'quantitative'},
+            ],
+        },
+    }
+
+
+@st.cache_data(max_entries=2048, show_spinner=False)
+def get_predicate_payload(predicate: str) -> tuple:
+    """Get cached corpus data, similar predicates, chart spec and table for a predicate."""
+    import pandas as pd
+    from utils.corpus_lookup import TYPE_NAMES
+    
+    lookup = get_corpus_lookup()
+    data = lookup.lookup(predicate)
+    if not data:
+        return data, [], None, None
+    similar = lookup.get_similar_predicates(predicate, limit=8)
+    
+    dist = data.get('distribution', {})
+    types_data = data.get('types', {})
+    
+    chart_data = []
+    for type_code in ['DA', 'SI', 'MS', 'ABT', 'EVAL', 'DISP']:
+        pct = dist.get(type_code, 0)
+        count = types_data.get(type_code, 0)
+        full_name, chinese = TYPE_NAMES.get(type_code, (type_code, ''))
+        chart_data.append({
+            'Type': full_name,
+            'Percentage': pct,
+            'Count': count,
+            'Chinese': chinese
+        })
+    
+    spec = get_bar_spec(tuple((row['Type'], row['Percentage']) for row in chart_data))
+    
+    # Table view: non-zero types with formatted numbers
+    df = pd.DataFrame(chart_data)
+    display_df = df[df['Percentage'] > 0].copy()
+    display_df['Percentage'] = display_df['Percentage'].apply(lambda x: f"{x:.1f}%")
+    display_df['Count'] = display_df['Count'].apply(lambda x: f"{x:,}")
+    return data, similar, spec, display_df
+
+
 def main():
     """Main application."""
+    inject_css()
+    
     with st.sidebar:
         st.title("🇨🇳 Navigation")
-        page = st.radio(
-            "Choose a page:",
-            [
-                "🏠 Home",
-                "🔍 Analyse Sentence",
-                "📖 Look Up Predicate",
-                "📚 Learn the Six Types",
-                "📊 Corpus Statistics",
-                "❓ Help"
-            ]
-        )
+        page = st.radio("Choose a page:", list(PAGES))
         
         st.divider()
         st.markdown("### About")
@@ -90,19 +205,7 @@ def main():
         using data from **394,355** real examples from the BCC corpus.
         """)
     
-    if page == "🏠 Home":
-        show_home()
-    elif page == "🔍 Analyse Sentence":
-        show_analysis()
-    elif page == "📖 Look Up Predicate":
-        show_predicate_lookup()
-    elif page == "📚 Learn the Six Types":
-        show_learning()
-    elif page == "📊 Corpus Statistics":
-        show_statistics()
-    elif page == "❓ Help":
-        show_help()
-
+    PAGES[page]()
 
 def show_home():
     """Home page."""
@@ -121,20 +224,22 @@ def show_home():
     st.markdown("### The Six Types at a Glance")
     
     cols = st.columns(3)
-    type_order = ['DA', 'SI', 'MS', 'ABT', 'EVAL', 'DISP']
     
-    for i, code in enumerate(type_order):
-        info = CONSTRUCTION_TYPES.get(code, {})
-        with cols[i % 3]:
-            colour = info.get('colour', '#808080')
-            st.markdown(f"""
-            <div style="background: {colour}20; padding: 12px; border-radius: 8px; 
-                        border-left: 4px solid {colour}; margin: 5px 0;">
-                <strong>{info.get('emoji', '')} {info.get('full_name', code)}</strong><br>
-                <span style="color: #666; font-size: 0.9em;">{info.get('chinese_name', '')}</span><br>
-                <span style="font-size: 0.85em;">{info.get('short_description', '')}</span>
-            </div>
-            """, unsafe_allow_html=True)
+    # Collect the cards per column and send one markdown element per column
+    col_html = ['', '', '']
+    for i, (code, (colour, emoji, full_name, chinese_name, short)) in enumerate(HOME_ORDER):
+        col_html[i % 3] += f"""
+        <div style="background: {colour}20; padding: 12px; border-radius: 8px; 
+                    border-left: 4px solid {colour}; margin: 5px 0;">
+            <strong>{emoji} {full_name}</strong><br>
+            <span style="color: #666; font-size: 0.9em;">{chinese_name}</span><br>
+            <span style="font-size: 0.85em;">{short}</span>
+        </div>
+        """
+    
+    for col, html in zip(cols, col_html):
+        with col:
+            st.markdown(html, unsafe_allow_html=True)
     
     st.markdown("---")
     
@@ -164,6 +269,11 @@ def show_home():
         """)
 
 
+def use_example(sentence: str):
+    """Button callback: load an example into the analysis input before the rerun."""
+    st.session_state["analyse_sentence"] = sentence
+
+
 def show_analysis():
     """Sentence analysis page."""
     st.title("🔍 Analyse Your Sentence")
@@ -173,28 +283,21 @@ def show_analysis():
     what construction type it is and why.
     """)
     
-    # Input
-    sentence = st.text_input(
-        "Enter a Chinese sentence with 对:",
-        placeholder="例如：专家对此发表意见",
-    )
+    # Input (a form, so the page reruns once per submit rather than per edit)
+    with st.form("analyse_form"):
+        sentence = st.text_input(
+            "Enter a Chinese sentence with 对:",
+            placeholder="例如：专家对此发表意见",
+            key="analyse_sentence",
+        )
+        st.form_submit_button("Analyse")
     
     # Example buttons
     st.markdown("**Or try an example:**")
-    examples = [
-        ("专家对此发表意见", "ABT"),
-        ("他对我说了几句话", "DA"),
-        ("政府对企业进行检查", "SI"),
-        ("我对这件事很担心", "MS"),
-        ("她对客人很热情", "DISP"),
-        ("运动对健康有益", "EVAL"),
-    ]
-    
     cols = st.columns(3)
-    for i, (ex, _) in enumerate(examples):
+    for i, (ex, _) in enumerate(EXAMPLES):
         with cols[i % 3]:
-            if st.button(ex, key=f"ex_{i}"):
-                sentence = ex
+            st.button(ex, key=f"ex_{i}", on_click=use_example, args=(ex,))
     
     if sentence and '对' in sentence:
         analyse_sentence(sentence)
@@ -204,35 +307,24 @@ def show_analysis():
 
 def analyse_sentence(sentence: str):
     """Analyse a sentence and display results."""
-    st.markdown("---")
-    
-    # Extract parts
-    parts = extract_dui_parts(sentence)
-    predicate = parts.get('predicate', '')
-    complement = parts.get('after_predicate', '')
-    y_phrase = parts.get('y_phrase', '')
+    from utils.corpus_lookup import TYPE_NAMES, TYPE_EXPLANATIONS
     
-    # Get corpus lookup
-    lookup = get_corpus_lookup()
+    st.markdown("---")
     
-    # Contextual analysis
-    analysis = lookup.analyse_in_context(
-        predicate, 
-        complement=complement,
-        y_phrase=y_phrase,
-        full_sentence=sentence
-    )
+    # Extract parts and analyse in context (cached per sentence)
+    result = get_sentence_analysis(sentence)
+    predicate = result['parts'].get('predicate', '')
+    analysis = result['analysis']
     
     result_type = analysis.get('contextual_type', 'DA')
-    info = CONSTRUCTION_TYPES.get(result_type, {})
-    colour = info.get('colour', '#808080')
+    colour, emoji, full_name, chinese_name, _ = get_card_meta(result_type)
     
     # Main result
     st.markdown(f"""
     <div style="background: {colour}20; padding: 25px; border-radius: 15px; 
                 border-left: 6px solid {colour};">
-        <h2 style="margin: 0;">{info.get('emoji', '')} {info.get('full_name', result_type)}</h2>
-        <p style="font-size: 1.2em; color: #666; margin: 5px 0;">{info.get('chinese_name', '')}</p>
+        <h2 style="margin: 0;">{emoji} {full_name}</h2>
+        <p style="font-size: 1.2em; color: #666; margin: 5px 0;">{chinese_name}</p>
         <p style="margin-top: 15px;"><strong>Your sentence:</strong> {sentence}</p>
     </div>
     """, unsafe_allow_html=True)
@@ -248,7 +340,7 @@ def analyse_sentence(sentence: str):
     if type_exp:
         st.markdown(f"""
         <div class="learning-tip">
-            <strong>Understanding {info.get('full_name', '')}:</strong><br>
+            <strong>Understanding {full_name}:</strong><br>
             {type_exp.get('description', '')}<br><br>
             <strong>Y's role:</strong> {type_exp.get('y_role', '')}<br><br>
             <strong>Test:</strong> {type_exp.get('test', '')}
@@ -265,29 +357,21 @@ def analyse_sentence(sentence: str):
             st.markdown(f"Found **{total:,}** instances of '**{predicate}**' with 对 in the BCC corpus:")
             
             # Distribution chart
-            dist = corpus_data.get('distribution', {})
-            if dist:
-                chart_data = []
-                for type_code, pct in sorted(dist.items(), key=lambda x: x[1], reverse=True):
-                    if pct > 0:
-                        full_name, _ = TYPE_NAMES.get(type_code, (type_code, ''))
-                        chart_data.append({'Type': full_name, 'Percentage': pct})
+            chart_items = result['chart_items']
+            if chart_items:
+                st.vega_lite_chart(get_bar_spec(chart_items), width="stretch")
                 
-                if chart_data:
-                    df = pd.DataFrame(chart_data)
-                    st.bar_chart(df.set_index('Type'))
-                    
-                    # Text explanation
-                    dominant = corpus_data.get('dominant_type', '')
-                    conf = corpus_data.get('confidence', 0)
-                    dominant_name, _ = TYPE_NAMES.get(dominant, (dominant, ''))
-                    
-                    if conf >= 0.9:
-                        st.success(f"'{predicate}' is almost always **{dominant_name}** ({conf*100:.0f}% of cases)")
-                    elif conf >= 0.6:
-                        st.info(f"'{predicate}' is usually **{dominant_name}** ({conf*100:.0f}% of cases), but can be other types depending on context")
-                    else:
-                        st.warning(f"'{predicate}' varies a lot by context! Most common is {dominant_name} ({conf*100:.0f}%), but other types are also frequent")
+                # Text explanation
+                dominant = corpus_data.get('dominant_type', '')
+                conf = corpus_data.get('confidence', 0)
+                dominant_name, _ = TYPE_NAMES.get(dominant, (dominant, ''))
+                
+                if conf >= 0.9:
+                    st.success(f"'{predicate}' is almost always **{dominant_name}** ({conf*100:.0f}% of cases)")
+                elif conf >= 0.6:
+                    st.info(f"'{predicate}' is usually **{dominant_name}** ({conf*100:.0f}% of cases), but can be other types depending on context")
+                else:
+                    st.warning(f"'{predicate}' varies a lot by context! Most common is {dominant_name} ({conf*100:.0f}%), but other types are also frequent")
         else:
             st.info(f"'{predicate}' was not found in the corpus. Classification based on rules.")
     
@@ -308,8 +392,6 @@ def show_predicate_lookup():
     with 对 in real Chinese texts.
     """)
     
-    lookup = get_corpus_lookup()
-    
     # Search input
     predicate = st.text_input(
         "Enter a predicate (verb/adjective):",
@@ -318,22 +400,23 @@ def show_predicate_lookup():
     
     # Common predicates
     st.markdown("**Common predicates to explore:**")
-    common = ['说', '进行', '有', '发表', '担心', '热情', '重要', '负责', '了解', '表示']
     cols = st.columns(5)
-    for i, pred in enumerate(common):
+    for i, pred in enumerate(COMMON_PREDICATES):
         with cols[i % 5]:
             if st.button(pred, key=f"common_{pred}"):
                 predicate = pred
     
     if predicate:
-        show_predicate_info(predicate, lookup)
+        show_predicate_info(predicate)
 
 
-def show_predicate_info(predicate: str, lookup: CorpusLookup):
+def show_predicate_info(predicate: str):
     """Show detailed info for a predicate."""
+    from utils.corpus_lookup import TYPE_NAMES, TYPE_EXPLANATIONS
+    
     st.markdown("---")
     
-    data = lookup.lookup(predicate)
+    data, similar, spec, display_df = get_predicate_payload(predicate)
     
     if not data:
         st.warning(f"'{predicate}' was not found in the corpus.")
@@ -346,8 +429,7 @@ def show_predicate_info(predicate: str, lookup: CorpusLookup):
     dominant_name, dominant_chinese = TYPE_NAMES.get(dominant, (dominant, ''))
     
     # Header
-    info = CONSTRUCTION_TYPES.get(dominant, {})
-    colour = info.get('colour', '#808080')
+    colour, emoji, _, _, _ = get_card_meta(dominant)
     
     st.markdown(f"""
     <div style="background: {colour}20; padding: 20px; border-radius: 10px; border-left: 5px solid {colour};">
@@ -355,37 +437,17 @@ def show_predicate_info(predicate: str, lookup: CorpusLookup):
         <p style="font-size: 1.1em; margin: 10px 0;">
             <strong>{total:,}</strong> instances in the BCC corpus
         </p>
-        <p>Most commonly: <strong>{info.get('emoji', '')} {dominant_name}</strong> ({conf*100:.0f}%)</p>
+        <p>Most commonly: <strong>{emoji} {dominant_name}</strong> ({conf*100:.0f}%)</p>
     </div>
     """, unsafe_allow_html=True)
     
     # Distribution
     st.markdown("### Distribution Across Types")
     
-    dist = data.get('distribution', {})
-    types_data = data.get('types', {})
-    
-    chart_data = []
-    for type_code in ['DA', 'SI', 'MS', 'ABT', 'EVAL', 'DISP']:
-        pct = dist.get(type_code, 0)
-        count = types_data.get(type_code, 0)
-        full_name, chinese = TYPE_NAMES.get(type_code, (type_code, ''))
-        chart_data.append({
-            'Type': full_name,
-            'Percentage': pct,
-            'Count': count,
-            'Chinese': chinese
-        })
-    
-    df = pd.DataFrame(chart_data)
-    
     # Show bar chart
-    st.bar_chart(df.set_index('Type')['Percentage'])
+    st.vega_lite_chart(spec, width="stretch")
     
     # Show table
-    display_df = df[df['Percentage'] > 0].copy()
-    display_df['Percentage'] = display_df['Percentage'].apply(lambda x: f"{x:.1f}%")
-    display_df['Count'] = display_df['Count'].apply(lambda x: f"{x:,}")
     st.dataframe(display_df, use_container_width=True, hide_index=True)
     
     # Explanation for dominant type
@@ -427,7 +489,6 @@ def show_predicate_info(predicate: str, lookup: CorpusLookup):
     
     # Similar predicates
     st.markdown("### Similar Predicates")
-    similar = lookup.get_similar_predicates(predicate, limit=8)
     if similar:
         cols = st.columns(4)
         for i, (pred, type_code, count) in enumerate(similar):
@@ -437,8 +498,9 @@ def show_predicate_info(predicate: str, lookup: CorpusLookup):
         st.markdown("No similar predicates found.")
 
 
+@st.cache_data
 def load_top_predicates():
-    """Load top predicates data."""
+    """Load top predicates data (once per process)."""
     top_pred_file = os.path.join(os.path.dirname(__file__), 'data', 'top_predicates.json')
     if os.path.exists(top_pred_file):
         with open(top_pred_file, 'r', encoding='utf-8') as f:
@@ -446,6 +508,93 @@ def load_top_predicates():
     return {}
 
 
+@st.cache_data
+def load_frequency_data():
+    """Load corpus frequency data (once per process), or None if missing."""
+    freq_file = os.path.join(os.path.dirname(__file__), 'data', 'frequency_data.json')
+    if os.path.exists(freq_file):
+        with open(freq_file, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    return None
+
+
+@st.cache_data
+def get_statistics_frame():
+    """Get the per-type statistics table (built once), or None if data is missing."""
+    import pandas as pd
+    
+    freq_data = load_frequency_data()
+    if freq_data is None:
+        return None
+    
+    chart_data = []
+    for code, card in STATS_ORDER:
+        if code in freq_data:
+            data = freq_data[code]
+            chart_data.append({
+                'Type': data.get('full_name', code),
+                'Instances': data.get('count', 0),
+                'Percentage': data.get('percent', 0),
+                'Top Predicate': data.get('top_predicate', ''),
+                'colour': card[0]
+            })
+    
+    return pd.DataFrame(chart_data)
+
+
+@st.cache_data
+def get_learning_content() -> dict:
+    """Get the pre-formatted Learning page content for each type (built once)."""
+    import pandas as pd
+    from utils.corpus_lookup import TYPE_EXPLANATIONS
+    
+    top_predicates = load_top_predicates()
+    
+    content = {}
+    for code, info in CONSTRUCTION_TYPES.items():
+        type_exp = TYPE_EXPLANATIONS.get(code, {})
+        entry = {
+            'label': f"{info['emoji']} {info['full_name']}",
+            'header': [
+                f"## {info['emoji']} {info['full_name']}",
+                f"**Chinese:** {info['chinese_name']}",
+                f"**In brief:** {info['short_description']}",
+            ],
+            'description': info.get('description', ''),
+            'examples': [f"- **{ch}** — _{en}_" for ch, en in info.get('examples', [])],
+            'test': type_exp.get('test', '') if type_exp else None,
+            'top': None,
+        }
+        
+        # Top 30 predicates for this type
+        if code in top_predicates:
+            preds = top_predicates[code]
+            
+            pred_data = []
+            for i, p in enumerate(preds[:30]):
+                pred_data.append({
+                    'Rank': i + 1,
+                    'Predicate': p['predicate'],
+                    'Count': f"{p['count']:,}",
+                    'Percentage': f"{p['percentage']:.1f}%"
+                })
+            
+            columns = []
+            for heading, start in (("**Top 10:**", 0), ("**11-20:**", 10), ("**21-30:**", 20)):
+                lines = [f"• **{p['predicate']}** ({p['count']:,})" for p in preds[start:start + 10]]
+                columns.append((heading, lines))
+            
+            entry['top'] = {
+                'intro': f"These are the most common predicates used with 对 in **{info['full_name']}** constructions:",
+                'columns': columns,
+                'table': pd.DataFrame(pred_data),
+            }
+        
+        content[code] = entry
+    
+    return content
+
+
 def show_learning():
     """Learning page with detailed type explanations."""
     st.title("📚 Learn the Six Construction Types")
@@ -455,75 +604,45 @@ def show_learning():
     what Chinese sentences mean.
     """)
     
-    # Load top predicates
-    top_predicates = load_top_predicates()
+    content = get_learning_content()
     
     # Tabs for each type
-    tab_labels = [f"{info['emoji']} {info['full_name']}" for info in CONSTRUCTION_TYPES.values()]
-    tabs = st.tabs(tab_labels)
+    tabs = st.tabs([entry['label'] for entry in content.values()])
     
-    for tab, (code, info) in zip(tabs, CONSTRUCTION_TYPES.items()):
+    for tab, entry in zip(tabs, content.values()):
         with tab:
-            colour = info.get('colour', '#808080')
-            
-            st.markdown(f"## {info['emoji']} {info['full_name']}")
-            st.markdown(f"**Chinese:** {info['chinese_name']}")
-            st.markdown(f"**In brief:** {info['short_description']}")
+            for line in entry['header']:
+                st.markdown(line)
             
             st.markdown("---")
-            st.markdown(info.get('description', ''))
+            st.markdown(entry['description'])
             
             # Examples
             st.markdown("### Examples")
-            for ch, en in info.get('examples', []):
-                st.markdown(f"- **{ch}** — _{en}_")
+            for line in entry['examples']:
+                st.markdown(line)
             
             # Type-specific explanation
-            type_exp = TYPE_EXPLANATIONS.get(code, {})
-            if type_exp:
+            if entry['test'] is not None:
                 st.markdown("### Quick Test")
-                st.info(type_exp.get('test', ''))
+                st.info(entry['test'])
             
             # Top 30 predicates for this type
-            if code in top_predicates:
+            top = entry['top']
+            if top is not None:
                 st.markdown("### 📊 Top 30 Predicates for This Type")
-                st.markdown(f"These are the most common predicates used with 对 in **{info['full_name']}** constructions:")
-                
-                preds = top_predicates[code]
-                
-                # Create a nice table
-                pred_data = []
-                for i, p in enumerate(preds[:30]):
-                    pred_data.append({
-                        'Rank': i + 1,
-                        'Predicate': p['predicate'],
-                        'Count': f"{p['count']:,}",
-                        'Percentage': f"{p['percentage']:.1f}%"
-                    })
-                
-                pred_df = pd.DataFrame(pred_data)
+                st.markdown(top['intro'])
                 
                 # Display in columns for better readability
-                col1, col2, col3 = st.columns(3)
-                
-                with col1:
-                    st.markdown("**Top 10:**")
-                    for p in preds[:10]:
-                        st.markdown(f"• **{p['predicate']}** ({p['count']:,})")
-                
-                with col2:
-                    st.markdown("**11-20:**")
-                    for p in preds[10:20]:
-                        st.markdown(f"• **{p['predicate']}** ({p['count']:,})")
-                
-                with col3:
-                    st.markdown("**21-30:**")
-                    for p in preds[20:30]:
-                        st.markdown(f"• **{p['predicate']}** ({p['count']:,})")
+                for col, (heading, lines) in zip(st.columns(3), top['columns']):
+                    with col:
+                        st.markdown(heading)
+                        for line in lines:
+                            st.markdown(line)
                 
                 # Expandable full table
                 with st.expander("📋 View Full Table"):
-                    st.dataframe(pred_df, use_container_width=True, hide_index=True)
+                    st.dataframe(top['table'], use_container_width=True, hide_index=True)
 
 
 def show_statistics():
@@ -535,47 +654,35 @@ def show_statistics():
     from the BCC (Beijing Chinese Corpus).
     """)
     
-    # Load frequency data
-    freq_file = os.path.join(os.path.dirname(__file__), 'data', 'frequency_data.json')
+    # Per-type table built from the frequency data (cached)
+    df = get_statistics_frame()
     
-    if os.path.exists(freq_file):
-        with open(freq_file, 'r', encoding='utf-8') as f:
-            freq_data = json.load(f)
-        
+    if df is not None:
         # Overview
         st.markdown("### Distribution by Type")
         
-        chart_data = []
-        for code in ['DA', 'MS', 'SI', 'EVAL', 'ABT', 'DISP']:
-            if code in freq_data:
-                data = freq_data[code]
-                info = CONSTRUCTION_TYPES.get(code, {})
-                chart_data.append({
-                    'Type': data.get('full_name', code),
-                    'Instances': data.get('count', 0),
-                    'Percentage': data.get('percent', 0),
-                    'Top Predicate': data.get('top_predicate', ''),
-                    'colour': info.get('colour', '#808080')
-                })
-        
-        df = pd.DataFrame(chart_data)
-        st.bar_chart(df.set_index('Type')['Percentage'])
+        chart_items = tuple(zip(df['Type'], df['Percentage'].astype(float)))
+        st.vega_lite_chart(get_bar_spec(chart_items), width="stretch")
         
         # Detailed cards
         st.markdown("### Detailed Breakdown")
         cols = st.columns(3)
+        col_html = ['', '', '']
         for i, row in df.iterrows():
-            with cols[i % 3]:
-                st.markdown(f"""
-                <div style="background: {row['colour']}20; padding: 15px; 
-                            border-radius: 10px; margin: 5px 0;
-                            border-left: 4px solid {row['colour']};">
-                    <strong>{row['Type']}</strong><br>
-                    <span style="font-size: 1.3em;">{row['Instances']:,}</span> instances<br>
-                    <span style="color: #666;">{row['Percentage']:.1f}%</span><br>
-                    <small>Top: {row['Top Predicate']}</small>
-                </div>
-                """, unsafe_allow_html=True)
+            col_html[i % 3] += f"""
+            <div style="background: {row['colour']}20; padding: 15px; 
+                        border-radius: 10px; margin: 5px 0;
+                        border-left: 4px solid {row['colour']};">
+                <strong>{row['Type']}</strong><br>
+                <span style="font-size: 1.3em;">{row['Instances']:,}</span> instances<br>
+                <span style="color: #666;">{row['Percentage']:.1f}%</span><br>
+                <small>Top: {row['Top Predicate']}</small>
+            </div>
+            """
+        
+        for col, html in zip(cols, col_html):
+            with col:
+                st.markdown(html, unsafe_allow_html=True)
     else:
         st.warning("Frequency data file not found.")
 
@@ -618,5 +725,16 @@ def show_help():
     """)
 
 
+# Sidebar label → page renderer (dispatched once per rerun in main)
+PAGES: Dict[str, Callable[[], None]] = {
+    "🏠 Home": show_home,
+    "🔍 Analyse Sentence": show_analysis,
+    "📖 Look Up Predicate": show_predicate_lookup,
+    "📚 Learn the Six Types": show_learning,
+    "📊 Corpus Statistics": show_statistics,
+    "❓ Help": show_help,
+}
+
+
 if __name__ == "__main__":
     main()
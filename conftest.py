@@ -0,0 +1 @@
+# Marks the repository root for pytest, so tests can import the utils package
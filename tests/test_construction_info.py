@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Tests for utils.construction_info."""
+
+import pytest
+
+from utils.construction_info import CONSTRUCTION_TYPES, classify_sentence
+from utils.predicate_extractor import extract_predicate_with_type
+
+# One sentence per construction type, each with a typical verb after 对
+TYPE_SENTENCES = {
+    'DA': '他对我说了几句话',
+    'SI': '政府对企业进行检查',
+    'MS': '我对这件事很担心',
+    'ABT': '专家对此发表意见',
+    'DISP': '她对客人很热情',
+    'EVAL': '运动对健康有益',
+}
+
+# A typical verb inside a common noun (问 in 问题) must not be matched
+NOUN_SENTENCES = {
+    '我对这个问题很关心': 'MS',
+    '我们对这个问题进行了深入研究': 'SI',
+}
+
+
+def test_every_type_has_a_sentence():
+    assert TYPE_SENTENCES.keys() == CONSTRUCTION_TYPES.keys()
+
+
+@pytest.mark.parametrize('type_code, sentence', TYPE_SENTENCES.items())
+def test_classify_sentence(type_code, sentence):
+    assert classify_sentence(sentence) == type_code
+
+
+@pytest.mark.parametrize('type_code, sentence', TYPE_SENTENCES.items())
+def test_classify_sentence_agrees_with_extractor(type_code, sentence):
+    assert extract_predicate_with_type(sentence)[1] == classify_sentence(sentence)
+
+
+@pytest.mark.parametrize('sentence, type_code', NOUN_SENTENCES.items())
+def test_classify_sentence_skips_common_nouns(sentence, type_code):
+    assert classify_sentence(sentence) == type_code
+    assert extract_predicate_with_type(sentence)[1] == type_code
+
+
+def test_classify_sentence_without_dui():
+    # 好 is a typical verb, but there is no 对 before it
+    assert classify_sentence('今天天气很好') is None
+
+
+def test_classify_sentence_without_typical_verb():
+    assert classify_sentence('他对这个') is None
+    assert classify_sentence('他对这个问题') is None
@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Tests for utils.corpus_lookup."""
+
+import itertools
+import json
+
+import pytest
+
+from utils.corpus_lookup import CONTEXT_OVERRIDES, MARKER_CATEGORIES, CorpusLookup
+
+# Small corpus with equal totals (ties keep corpus order) and confidences
+# exactly 0.2 apart, where float error decides the < 0.2 test
+CORPUS = {
+    '说': {'dominant_type': 'DA', 'confidence': 0.5, 'total': 100},
+    '讲': {'dominant_type': 'DA', 'confidence': 0.7, 'total': 50},
+    '喊': {'dominant_type': 'DA', 'confidence': 0.3, 'total': 50},
+    '叫': {'dominant_type': 'DA', 'confidence': 0.69, 'total': 50},
+    '问': {'dominant_type': 'DA', 'confidence': 0.31, 'total': 200},
+    '答': {'dominant_type': 'DA', 'confidence': 0.9, 'total': 10},
+    '笑': {'dominant_type': 'DA', 'confidence': 0.1, 'total': 10},
+    '骂': {'dominant_type': 'DA', 'confidence': 0.5, 'total': 100},
+    '进行': {'dominant_type': 'SI', 'confidence': 0.5, 'total': 300},
+    '实施': {'dominant_type': 'SI', 'confidence': 0.4, 'total': 300},
+    '帮助': {'dominant_type': 'SI', 'confidence': 0.6, 'total': 300},
+    '担心': {'dominant_type': 'MS', 'confidence': 1.0, 'total': 20},
+    '害怕': {'dominant_type': 'MS', 'confidence': 0.8, 'total': 20},
+    '发表': {'dominant_type': 'ABT', 'confidence': 0.75, 'total': 80},
+    '有': {'dominant_type': 'EVAL', 'confidence': 0.4, 'total': 500},
+}
+
+
+@pytest.fixture
+def lookup(tmp_path):
+    corpus_file = tmp_path / 'predicate_corpus.json'
+    corpus_file.write_text(json.dumps(CORPUS, ensure_ascii=False), encoding='utf-8')
+    return CorpusLookup(str(corpus_file))
+
+
+def similar_by_scan(predicate, limit):
+    """The plain scan get_similar_predicates must reproduce."""
+    data = CORPUS.get(predicate)
+    if not data:
+        return []
+    similar = [
+        (pred, pred_data['dominant_type'], pred_data['total'])
+        for pred, pred_data in CORPUS.items()
+        if pred != predicate
+        and pred_data['dominant_type'] == data['dominant_type']
+        and abs(pred_data['confidence'] - data['confidence']) < 0.2
+    ]
+    similar.sort(key=lambda x: x[2], reverse=True)
+    return similar[:limit]
+
+
+@pytest.mark.parametrize('predicate', [*CORPUS, '不存在'])
+@pytest.mark.parametrize('limit', [1, 3, 5, 20])
+def test_get_similar_predicates_matches_scan(lookup, predicate, limit):
+    assert lookup.get_similar_predicates(predicate, limit=limit) == similar_by_scan(predicate, limit)
+
+
+BATCH_ITEMS = [
+    {'predicate': '发表', 'complement': '意见', 'y_phrase': '此', 'full_sentence': '专家对此发表意见'},
+    {'predicate': '发表', 'complement': '微笑'},
+    {'predicate': '说', 'y_phrase': '我'},
+    {'predicate': '感兴趣'},
+    {'predicate': '不存在'},
+    {},
+    {'predicate': '发表', 'complement': '意见', 'y_phrase': '此', 'full_sentence': '专家对此发表意见'},
+]
+
+
+def test_analyse_in_context_batch_matches_single(lookup):
+    expected = [
+        lookup.analyse_in_context(
+            item.get('predicate', ''),
+            complement=item.get('complement', ''),
+            y_phrase=item.get('y_phrase', ''),
+            full_sentence=item.get('full_sentence', ''),
+        )
+        for item in BATCH_ITEMS
+    ]
+    assert lookup.analyse_in_context_batch(BATCH_ITEMS) == expected
+
+
+def test_analyse_in_context_batch_returns_fresh_results(lookup):
+    expected = lookup.analyse_in_context_batch(BATCH_ITEMS)
+    results = lookup.analyse_in_context_batch(BATCH_ITEMS)
+    assert results[0] is not results[-1]  # same item, separate results
+    for result in results:
+        result['contextual_type'] = 'changed'
+        result['corpus_data']['total'] = -1
+        result['learning_notes'].append('changed')
+    assert lookup.analyse_in_context_batch(BATCH_ITEMS) == expected
+
+
+def marker_hit_by_loop(predicate, context_text):
+    """The plain marker loop the precompiled scans must reproduce."""
+    override = CONTEXT_OVERRIDES[predicate]
+    for type_code, meaning in MARKER_CATEGORIES:
+        for marker in override.get(f'{type_code}_markers', []):
+            if marker in context_text:
+                return type_code, f"Contains '{marker}' which indicates {meaning}"
+    return None
+
+
+def marker_contexts(predicate):
+    """Single markers, every ordered pair (same or other category) and no marker."""
+    override = CONTEXT_OVERRIDES[predicate]
+    markers = [
+        marker
+        for type_code, _ in MARKER_CATEGORIES
+        for marker in override.get(f'{type_code}_markers', [])
+    ]
+    yield ''
+    yield '没有标记'
+    yield from markers
+    for first, second in itertools.permutations(markers, 2):
+        yield first + second
+
+
+MARKER_PREDICATES = [
+    predicate for predicate, override in CONTEXT_OVERRIDES.items()
+    if 'default' not in override
+]
+
+
+@pytest.mark.parametrize('predicate', MARKER_PREDICATES)
+def test_marker_scans_match_loop(lookup, predicate):
+    for context_text in marker_contexts(predicate):
+        result = lookup.analyse_in_context(predicate, complement=context_text)
+        reason = result['contextual_reason'] or ''
+        hit = (result['contextual_type'], reason) if reason.startswith('Contains') else None
+        assert hit == marker_hit_by_loop(predicate, context_text), context_text
@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Tests for utils.predicate_extractor."""
+
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from utils.construction_info import PREDICATE_TO_TYPE
+from utils.predicate_extractor import (
+    JIEBA_AVAILABLE,
+    PREDICATE_TYPES,
+    DuiParts,
+    clear_caches,
+    extract_dui_parts,
+    extract_dui_parts_batch,
+    extract_dui_parts_columns,
+    extract_predicate_with_type,
+)
+
+SENTENCES = [
+    '专家对此发表意见',
+    '他对我说了几句话',
+    '我对他的行为非常不满',
+    '他对此不重视',
+    '我们对这个问题进行了深入研究',
+    '今天天气很好',
+    '',
+    '专家对此发表意见',  # repeated: served from the cache
+]
+
+
+@pytest.fixture(autouse=True)
+def fresh_caches():
+    # Each test starts from empty caches, so a first call really extracts
+    clear_caches()
+    yield
+    clear_caches()
+
+
+def test_predicate_types_agree_with_construction_info():
+    # Two word → type tables; they must agree on every word they share
+    shared = PREDICATE_TYPES.keys() & PREDICATE_TO_TYPE.keys()
+    assert shared
+    mismatches = {
+        word: (PREDICATE_TYPES[word], PREDICATE_TO_TYPE[word])
+        for word in shared
+        if PREDICATE_TYPES[word] != PREDICATE_TO_TYPE[word]
+    }
+    assert mismatches == {}
+
+
+def test_extract_predicate_with_type():
+    assert extract_predicate_with_type('我对他很重视') == ('重视', 'MS')
+    assert extract_predicate_with_type('他对此不重视') == ('不重视', 'MS')
+    assert extract_predicate_with_type('专家对此发表意见') == ('发表', 'ABT')
+    assert extract_predicate_with_type('今天天气很好') == ('', None)
+
+
+def test_extract_predicate_with_type_without_jieba():
+    # Block jieba in a fresh interpreter; the type table must not depend on it
+    code = (
+        "import sys; sys.modules['jieba'] = None\n"
+        "from utils.predicate_extractor import JIEBA_AVAILABLE, extract_predicate_with_type\n"
+        "assert not JIEBA_AVAILABLE\n"
+        "print(extract_predicate_with_type('我对他很重视'))\n"
+    )
+    result = subprocess.run(
+        [sys.executable, '-c', code], capture_output=True, text=True, check=True,
+        cwd=Path(__file__).resolve().parent.parent,
+    )
+    assert result.stdout.strip() == "('重视', 'MS')"
+
+
+def test_extract_dui_parts_batch_matches_single():
+    assert extract_dui_parts_batch(SENTENCES) == [extract_dui_parts(s) for s in SENTENCES]
+
+
+def test_extract_dui_parts_batch_returns_fresh_dicts():
+    first = extract_dui_parts_batch(SENTENCES)
+    assert first[0] is not first[-1]  # same sentence, separate dicts
+    for parts in first:
+        parts['predicate'] = 'changed'
+    assert extract_dui_parts_batch(SENTENCES) == [extract_dui_parts(s) for s in SENTENCES]
+    assert extract_dui_parts(SENTENCES[0])['predicate'] == '发表'
+
+
+def test_clear_caches_keeps_results():
+    before = extract_dui_parts_batch(SENTENCES)
+    clear_caches()
+    assert extract_dui_parts_batch(SENTENCES) == before
+
+
+def test_extract_dui_parts_columns_matches_single():
+    rows = [extract_dui_parts(s) for s in SENTENCES]
+    columns = extract_dui_parts_columns(SENTENCES)
+    assert list(columns) == list(rows[0])
+    assert columns == {field: [row[field] for row in rows] for field in columns}
+
+
+def test_extract_dui_parts_columns_returns_fresh_lists():
+    expected = extract_dui_parts_columns(SENTENCES)
+    columns = extract_dui_parts_columns(SENTENCES)
+    columns['predicate'][0] = 'changed'
+    columns['y_phrase'].clear()
+    assert extract_dui_parts_columns(SENTENCES) == expected
+    assert extract_dui_parts(SENTENCES[0])['predicate'] == '发表'
+
+
+# Expected parts per extraction path, as (sentence, before_dui, y_phrase,
+# predicate, after_predicate, full_after_dui). Segmentation is jieba's.
+EXTRACTION_CASES = [
+    # Degree adverb, then a known predicate / an unknown word / a predicate word plus 的
+    ('我对这件事很担心', '我', '这件事', '担心', '', '这件事很担心'),
+    ('他对我很凶', '他', '我', '凶', '', '我很凶'),
+    ('他对此非常关心的', '他', '此', '关心', '的', '此非常关心的'),
+    # Negation look-ahead: 不 + 重视, and 不 + a non-predicate (太), where the
+    # adverb path then takes over
+    ('他对此不重视', '他', '此', '不重视', '', '此不重视'),
+    ('我对他不太满意', '我', '他不', '满意', '', '他不太满意'),
+    # Predicate at the start of a longer word, with or without a negation prefix
+    ('他对此负有责任', '他', '此', '负', '有责任', '此负有责任'),
+    ('他对我说话', '他', '我', '说', '话', '我说话'),
+    ('我对他不好意思', '我', '他', '不好', '意思', '他不好意思'),
+    # Predicate followed by a particle: split off as its own word, or (笑了笑)
+    # kept whole because a particle directly after 笑 blocks the prefix match
+    ('他对此关心的', '他', '此', '关心', '的', '此关心的'),
+    ('他对我笑了笑', '他', '我', '笑了笑', '', '我笑了笑'),
+    # COMMON_NOUNS guard: 问题 is not read as 问
+    ('我对这个问题很关心', '我', '这个问题', '关心', '', '这个问题很关心'),
+    # 2-character fallback, skipping words that end in a person suffix
+    ('他对此着迷', '他', '此', '着迷', '', '此着迷'),
+    ('我对年轻人着迷', '我', '年轻人', '着迷', '', '年轻人着迷'),
+    # No 对
+    ('今天天气很好', '', '', '', '', ''),
+]
+
+
+@pytest.mark.skipif(not JIEBA_AVAILABLE, reason='expected parts assume jieba segmentation')
+@pytest.mark.parametrize('case', EXTRACTION_CASES, ids=lambda case: case[0])
+def test_extract_dui_parts_paths(case):
+    sentence, *expected = case
+    assert extract_dui_parts(sentence) == DuiParts(*expected)._asdict()
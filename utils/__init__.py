@@ -4,50 +4,66 @@
 Utils Package
 =============
 Utility modules for the 对-construction analyser app.
+
+Submodules are imported lazily (PEP 562): importing ``utils`` is cheap, and
+e.g. jieba or the corpus module only load when one of their names is used.
 """
 
-from .construction_info import (
-    CONSTRUCTION_TYPES,
-    COMPARISON_TABLE,
-    KEY_DISTINCTIONS,
-    get_type_info,
-    get_full_name,
-    get_chinese_name,
-    get_all_types,
-    format_type_display
-)
-from .predicate_extractor import (
-    extract_dui_parts,
-    extract_predicate,
-    extract_y_phrase,
-    guess_y_animacy
-)
-from .corpus_lookup import (
-    CorpusLookup,
-    TYPE_NAMES,
-    TYPE_EXPLANATIONS,
-    get_type_name,
-    get_type_explanation,
-    lookup_predicate
-)
-
-__all__ = [
-    'CONSTRUCTION_TYPES',
-    'COMPARISON_TABLE',
-    'KEY_DISTINCTIONS',
-    'get_type_info',
-    'get_full_name',
-    'get_chinese_name',
-    'get_all_types',
-    'format_type_display',
-    'extract_dui_parts',
-    'extract_predicate',
-    'extract_y_phrase',
-    'guess_y_animacy',
-    'CorpusLookup',
-    'TYPE_NAMES',
-    'TYPE_EXPLANATIONS',
-    'get_type_name',
-    'get_type_explanation',
-    'lookup_predicate',
-]
+import importlib
+
+# Exported names, grouped by the submodule that defines them
+_SUBMODULE_EXPORTS = {
+    '.construction_info': (
+        'CONSTRUCTION_TYPES',
+        'COMPARISON_TABLE',
+        'KEY_DISTINCTIONS',
+        'PREDICATE_TO_TYPE',
+        'get_type_info',
+        'get_full_name',
+        'get_chinese_name',
+        'get_all_types',
+        'format_type_display',
+        'classify_sentence',
+    ),
+    '.predicate_extractor': (
+        'DuiParts',
+        'extract_dui_parts',
+        'extract_dui_parts_batch',
+        'extract_dui_parts_columns',
+        'extract_predicate',
+        'extract_predicate_with_type',
+        'extract_y_phrase',
+        'guess_y_animacy',
+    ),
+    '.corpus_lookup': (
+        'CorpusLookup',
+        'TYPE_NAMES',
+        'TYPE_EXPLANATIONS',
+        'get_type_name',
+        'get_type_explanation',
+        'lookup_predicate',
+    ),
+}
+
+# Exported name → submodule
+_LAZY_EXPORTS = {
+    name: module
+    for module, names in _SUBMODULE_EXPORTS.items()
+    for name in names
+}
+
+__all__ = list(_LAZY_EXPORTS)
+
+
+def __getattr__(name):
+    """Import the defining submodule on first access to an exported name."""
+    module = _LAZY_EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value  # Later lookups skip __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -7,8 +7,35 @@ Full names, descriptions, and examples for each 对-construction type.
 User-friendly content for display in the Streamlit app.
 """
 
-# Construction type definitions with full names (no acronyms in display)
-CONSTRUCTION_TYPES = {
+import re
+from functools import cache
+from types import MappingProxyType
+from typing import Any, Iterable, Mapping, Optional, Tuple
+
+
+def _freeze(value: Any) -> Any:
+    """Recursively turn dicts into read-only mappings and lists into tuples."""
+    if isinstance(value, dict):
+        return MappingProxyType({k: _freeze(v) for k, v in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+def _longest_first(words: Iterable[str]) -> Tuple[str, ...]:
+    """
+    Dedupe words (first occurrence wins) and order them longest first.
+    An alternation built from this always prefers the longest match, and
+    equal-length words keep their listed order, so patterns are identical
+    on every run (set order changes with hash randomisation).
+    """
+    return tuple(sorted(dict.fromkeys(words), key=len, reverse=True))
+
+
+# Construction type definitions with full names (no acronyms in display).
+# All tables in this module are frozen: they never change at runtime, which
+# keeps the getters below (and caching in the app) safe to share.
+CONSTRUCTION_TYPES = _freeze({
     'DA': {
         'code': 'DA',
         'full_name': 'Directed-Action',
@@ -188,43 +215,99 @@ of reference from which X is judged.
         'colour': '#FCBAD3',
         'emoji': '⚖️'
     }
-}
+})
+
+
+# Flat per-field tables (code → value), so getters and display helpers read
+# one small dict instead of walking the nested definitions
+_FULL_NAMES = {code: info['full_name'] for code, info in CONSTRUCTION_TYPES.items()}
+_CHINESE_NAMES = {code: info['chinese_name'] for code, info in CONSTRUCTION_TYPES.items()}
+_EMOJIS = {code: info.get('emoji', '') for code, info in CONSTRUCTION_TYPES.items()}
 
+# Shared read-only result for unknown codes
+_NO_INFO = MappingProxyType({})
 
-def get_type_info(code: str) -> dict:
+
+def get_type_info(code: str) -> Mapping[str, Any]:
     """Get information for a construction type by code."""
-    return CONSTRUCTION_TYPES.get(code, {})
+    return CONSTRUCTION_TYPES.get(code, _NO_INFO)
 
 
 def get_full_name(code: str) -> str:
     """Get full name for a construction type code."""
-    info = CONSTRUCTION_TYPES.get(code, {})
-    return info.get('full_name', code)
+    return _FULL_NAMES.get(code, code)
 
 
 def get_chinese_name(code: str) -> str:
     """Get Chinese name for a construction type code."""
-    info = CONSTRUCTION_TYPES.get(code, {})
-    return info.get('chinese_name', '')
+    return _CHINESE_NAMES.get(code, '')
 
 
-def get_all_types() -> dict:
+def get_all_types() -> Mapping[str, Mapping[str, Any]]:
     """Get all construction type definitions."""
     return CONSTRUCTION_TYPES
 
 
+# Flat typical-verb → type code map, built once from CONSTRUCTION_TYPES
+PREDICATE_TO_TYPE = {
+    verb: code
+    for code, info in CONSTRUCTION_TYPES.items()
+    for verb in info['typical_verbs']
+}
+
+
+@cache
+def _typical_verb_scan() -> Tuple[re.Pattern, Mapping[str, Optional[str]]]:
+    """
+    Build the classify_sentence pattern on first use: all typical verbs and
+    the extractor's COMMON_NOUNS in one alternation, longest first. Nouns map
+    to None, so a verb inside a noun (问 in 问题) is skipped, not matched.
+    """
+    from .predicate_extractor import COMMON_NOUNS
+    
+    words = {**PREDICATE_TO_TYPE, **dict.fromkeys(sorted(COMMON_NOUNS))}
+    pattern = re.compile('|'.join(map(re.escape, _longest_first(words))))
+    return pattern, words
+
+
+def classify_sentence(sentence: str) -> Optional[str]:
+    """
+    Quick first guess at the construction type of a sentence.
+    
+    Finds the first typical verb after 对 in a single scan, without
+    extracting the Y phrase and predicate. Common nouns are skipped as
+    whole words. Returns None if there is no 对 or no typical verb follows it.
+    """
+    dui_index = sentence.find('对')
+    if dui_index < 0:
+        return None
+    pattern, words = _typical_verb_scan()
+    for match in pattern.finditer(sentence, dui_index + 1):
+        type_code = words[match.group()]
+        if type_code is not None:
+            return type_code
+    return None
+
+
+# Display strings are fixed, so build them once at import
+_DISPLAY_NO_EMOJI = {
+    code: f"{_FULL_NAMES[code]} ({_CHINESE_NAMES[code]})"
+    for code in CONSTRUCTION_TYPES
+}
+_DISPLAY_WITH_EMOJI = {
+    code: f"{_EMOJIS[code]} {display}"
+    for code, display in _DISPLAY_NO_EMOJI.items()
+}
+
+
 def format_type_display(code: str, include_emoji: bool = True) -> str:
     """Format a construction type for display."""
-    info = CONSTRUCTION_TYPES.get(code, {})
-    if not info:
-        return code
-    
-    emoji = info.get('emoji', '') + ' ' if include_emoji else ''
-    return f"{emoji}{info['full_name']} ({info['chinese_name']})"
+    displays = _DISPLAY_WITH_EMOJI if include_emoji else _DISPLAY_NO_EMOJI
+    return displays.get(code, code)
 
 
 # Comparison data for the comparison page
-COMPARISON_TABLE = [
+COMPARISON_TABLE = _freeze([
     {
         'Type': 'Directed-Action',
         'Chinese': '指向动作',
@@ -273,11 +356,11 @@ COMPARISON_TABLE = [
         "X's Role": 'Theme (evaluated)',
         'Y Affected?': 'Benefits/suffers'
     }
-]
+])
 
 
 # Key distinctions for help page
-KEY_DISTINCTIONS = {
+KEY_DISTINCTIONS = _freeze({
     'MS_vs_ABT': {
         'title': 'Mental-State vs Aboutness',
         'description': '''
@@ -324,4 +407,4 @@ Both involve action toward Y, but:
 **Quick test:** Can you observe it directly? If yes → Disposition
 ''',
     }
-}
+})
@@ -10,8 +10,11 @@ For Chinese language learners to understand how predicates are typically used
 and why certain contexts lead to different classifications.
 """
 
+import functools
 import json
 import os
+import re
+from bisect import bisect_left, bisect_right
 from typing import Dict, Any, Optional, List, Tuple
 
 # Full names for construction types
@@ -116,6 +119,42 @@ CONTEXT_OVERRIDES = {
     },
 }
 
+# Marker categories in the order they are checked, with the reason wording
+MARKER_CATEGORIES = (
+    ('ABT', 'discourse/commentary'),
+    ('MS', 'psychological state'),
+    ('EVAL', 'evaluation/effect'),
+    ('DA', 'directed action'),
+)
+
+
+# Per predicate: ((type_code, compiled alternation, markers in list order), ...)
+MarkerScans = Dict[str, Tuple[Tuple[str, re.Pattern, Tuple[str, ...]], ...]]
+
+
+def _compile_marker_scans(overrides: Dict[str, Dict[str, Any]]) -> MarkerScans:
+    """
+    Precompile the marker lists of each override into one regex per category.
+    
+    A single regex search tells whether any marker of a category occurs in the
+    context; only on a hit are the markers tried in list order, so the marker
+    reported is the same one the plain loop would find.
+    """
+    scans = {}
+    for predicate, override in overrides.items():
+        entries = []
+        for type_code, _ in MARKER_CATEGORIES:
+            markers = tuple(override.get(f'{type_code}_markers', []))
+            if markers:
+                pattern = re.compile('|'.join(map(re.escape, markers)))
+                entries.append((type_code, pattern, markers))
+        scans[predicate] = tuple(entries)
+    return scans
+
+
+_MARKER_SCANS = _compile_marker_scans(CONTEXT_OVERRIDES)
+_MARKER_MEANINGS = dict(MARKER_CATEGORIES)
+
 
 class CorpusLookup:
     """Lookup system for predicate analysis based on BCC corpus data."""
@@ -143,6 +182,23 @@ class CorpusLookup:
         if corpus_file and os.path.exists(corpus_file):
             with open(corpus_file, 'r', encoding='utf-8') as f:
                 self.corpus_data = json.load(f)
+        
+        # Per-instance memo caches; corpus_data is treated as read-only from here
+        # on, and the public methods hand out copies of the cached results
+        self._lookup_cached = functools.lru_cache(maxsize=4096)(self._lookup_uncached)
+        self._analyse_cached = functools.lru_cache(maxsize=4096)(self._analyse_uncached)
+        
+        # For get_similar_predicates: dominant_type → entries sorted by confidence,
+        # as (confidence, corpus position, total, predicate), plus their confidences
+        self._type_buckets: Dict[Any, List[Tuple[float, int, int, str]]] = {}
+        for pos, (pred, pred_data) in enumerate(self.corpus_data.items()):
+            self._type_buckets.setdefault(pred_data.get('dominant_type'), []).append(
+                (pred_data.get('confidence', 0), pos, pred_data.get('total', 0), pred)
+            )
+        self._bucket_confidences: Dict[Any, List[float]] = {}
+        for type_code, bucket in self._type_buckets.items():
+            bucket.sort()
+            self._bucket_confidences[type_code] = [entry[0] for entry in bucket]
     
     def lookup(self, predicate: str) -> Optional[Dict[str, Any]]:
         """
@@ -154,6 +210,11 @@ class CorpusLookup:
         Returns:
             Dictionary with corpus statistics, or None if not found
         """
+        data = self._lookup_cached(predicate)
+        return dict(data) if data is not None else None
+    
+    def _lookup_uncached(self, predicate: str) -> Optional[Dict[str, Any]]:
+        """Build the augmented corpus entry for a predicate (see lookup)."""
         if predicate in self.corpus_data:
             data = self.corpus_data[predicate].copy()
             
@@ -179,7 +240,7 @@ class CorpusLookup:
         Returns:
             Formatted string describing the corpus distribution
         """
-        data = self.lookup(predicate)
+        data = self._lookup_cached(predicate)  # Read-only use, no copy needed
         if not data:
             return f"'{predicate}' was not found in the corpus."
         
@@ -211,7 +272,17 @@ class CorpusLookup:
         Returns:
             Analysis with corpus data and contextual interpretation
         """
-        corpus_data = self.lookup(predicate) or {}
+        result = self._analyse_cached(predicate, complement, y_phrase, full_sentence)
+        return {
+            **result,
+            'corpus_data': dict(result['corpus_data']),
+            'learning_notes': list(result['learning_notes']),
+        }
+    
+    def _analyse_uncached(self, predicate: str, complement: str,
+                          y_phrase: str, full_sentence: str) -> Dict[str, Any]:
+        """Run the contextual analysis (see analyse_in_context)."""
+        corpus_data = self._lookup_cached(predicate) or {}  # Copied on the way out
         context_text = complement + y_phrase + full_sentence
         
         result = {
@@ -233,40 +304,14 @@ class CorpusLookup:
                 result['contextual_reason'] = override.get('explanation', f"'{predicate}' is typically this type")
                 return result
             
-            # Check ABT markers
-            for marker in override.get('ABT_markers', []):
-                if marker in context_text:
-                    result['contextual_type'] = 'ABT'
-                    result['contextual_reason'] = f"Contains '{marker}' which indicates discourse/commentary"
+            # Check ABT, MS, EVAL, then DA markers; the first category with a hit wins
+            for type_code, pattern, markers in _MARKER_SCANS.get(predicate, ()):
+                if pattern.search(context_text):
+                    marker = next(m for m in markers if m in context_text)
+                    result['contextual_type'] = type_code
+                    result['contextual_reason'] = f"Contains '{marker}' which indicates {_MARKER_MEANINGS[type_code]}"
                     result['learning_notes'].append(override.get('explanation', ''))
                     break
-            
-            # Check MS markers
-            if not result['contextual_type']:
-                for marker in override.get('MS_markers', []):
-                    if marker in context_text:
-                        result['contextual_type'] = 'MS'
-                        result['contextual_reason'] = f"Contains '{marker}' which indicates psychological state"
-                        result['learning_notes'].append(override.get('explanation', ''))
-                        break
-            
-            # Check EVAL markers
-            if not result['contextual_type']:
-                for marker in override.get('EVAL_markers', []):
-                    if marker in context_text:
-                        result['contextual_type'] = 'EVAL'
-                        result['contextual_reason'] = f"Contains '{marker}' which indicates evaluation/effect"
-                        result['learning_notes'].append(override.get('explanation', ''))
-                        break
-            
-            # Check DA markers
-            if not result['contextual_type']:
-                for marker in override.get('DA_markers', []):
-                    if marker in context_text:
-                        result['contextual_type'] = 'DA'
-                        result['contextual_reason'] = f"Contains '{marker}' which indicates directed action"
-                        result['learning_notes'].append(override.get('explanation', ''))
-                        break
         
         # If no override, use corpus dominant type
         if not result['contextual_type'] and corpus_data:
@@ -281,6 +326,29 @@ class CorpusLookup:
         
         return result
     
+    def analyse_in_context_batch(self, items: List[Dict[str, str]]) -> List[Dict[str, Any]]:
+        """
+        Analyse many predicates in context (e.g. a drill or homework set).
+        
+        Args:
+            items: Dicts with a 'predicate' key and optional 'complement',
+                   'y_phrase' and 'full_sentence' keys, as for analyse_in_context
+            
+        Returns:
+            One analysis per item, in the same order
+        """
+        # Bind once; repeated items are served from the memo cache
+        analyse = self.analyse_in_context
+        return [
+            analyse(
+                item.get('predicate', ''),
+                complement=item.get('complement', ''),
+                y_phrase=item.get('y_phrase', ''),
+                full_sentence=item.get('full_sentence', ''),
+            )
+            for item in items
+        ]
+    
     def get_similar_predicates(self, predicate: str, limit: int = 5) -> List[Tuple[str, str, int]]:
         """
         Find predicates with similar classification patterns.
@@ -292,26 +360,28 @@ class CorpusLookup:
         Returns:
             List of (predicate, dominant_type, count) tuples
         """
-        data = self.lookup(predicate)
+        data = self._lookup_cached(predicate)  # Read-only use, no copy needed
         if not data:
             return []
         
         target_type = data.get('dominant_type')
         target_conf = data.get('confidence', 0)
         
-        similar = []
-        for pred, pred_data in self.corpus_data.items():
-            if pred == predicate:
-                continue
-            if pred_data.get('dominant_type') == target_type:
-                conf = pred_data.get('confidence', 0)
-                # Similar confidence level
-                if abs(conf - target_conf) < 0.2:
-                    similar.append((pred, target_type, pred_data.get('total', 0)))
+        # Same dominant type, similar confidence level: bisect a slightly wider
+        # window out of the type's bucket, then apply the exact test
+        bucket = self._type_buckets.get(target_type, [])
+        confidences = self._bucket_confidences.get(target_type, [])
+        lo = bisect_left(confidences, target_conf - 0.2 - 1e-9)
+        hi = bisect_right(confidences, target_conf + 0.2 + 1e-9)
+        similar = [
+            (pos, pred, total)
+            for conf, pos, total, pred in bucket[lo:hi]
+            if pred != predicate and abs(conf - target_conf) < 0.2
+        ]
         
-        # Sort by count and limit
-        similar.sort(key=lambda x: x[2], reverse=True)
-        return similar[:limit]
+        # Sort by count (ties keep corpus order) and limit
+        similar.sort(key=lambda x: (-x[2], x[0]))
+        return [(pred, target_type, total) for _, pred, total in similar[:limit]]
 
 
 def get_type_explanation(type_code: str) -> Dict[str, Any]:
@@ -324,11 +394,16 @@ def get_type_name(type_code: str) -> Tuple[str, str]:
     return TYPE_NAMES.get(type_code, (type_code, ''))
 
 
+@functools.cache
+def _default_lookup() -> CorpusLookup:
+    """Shared lookup over the default corpus file, loaded on first use."""
+    return CorpusLookup()
+
+
 # Convenience function
 def lookup_predicate(predicate: str) -> Optional[Dict[str, Any]]:
     """Quick lookup of a predicate."""
-    lookup = CorpusLookup()
-    return lookup.lookup(predicate)
+    return _default_lookup().lookup(predicate)
 
 
 if __name__ == "__main__":
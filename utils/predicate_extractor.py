@@ -12,17 +12,15 @@ Key improvements:
 - Handles cases where jieba combines predicate+complement
 """
 
+import functools
 import re
-from typing import Tuple, Optional, Dict, List
+import threading
+from typing import Tuple, Optional, Dict, List, NamedTuple, Iterable, Sequence
 
-# Try to import jieba
-try:
-    import jieba
-    JIEBA_AVAILABLE = True
-    
-    # Add common predicates to ensure they're segmented correctly
-    PREDICATE_WORDS = [
-        # Mental State (MS)
+# Common predicates, grouped by the construction type they usually signal.
+# Static data, so it is defined with or without jieba.
+PREDICATES_BY_TYPE = {
+    'MS': [  # Mental State (MS)
         '喜欢', '讨厌', '害怕', '担心', '担忧', '恐惧', '忧虑',
         '满意', '不满', '失望', '绝望', '感激', '感恩', '怨恨', '痛恨',
         '佩服', '敬佩', '钦佩', '崇拜', '景仰', '惊讶', '惊喜', '诧异',
@@ -36,32 +34,47 @@ try:
         '感兴趣', '有兴趣', '没兴趣', '没有兴趣', '不感兴趣',
         '有好感', '有信心', '有把握', '有印象', '没印象',
         '有意见', '有看法', '抱有', '怀有', '持有',
-        # Aboutness (ABT)
+    ],
+    'ABT': [  # Aboutness (ABT)
         '发表', '表态', '置评', '发言', '评价', '评论', '评述', '点评',
         '分析', '研究', '探讨', '考察', '调查', '调研',
         '讨论', '辩论', '争论', '商议', '商讨',
         '报道', '报告', '陈述', '描述', '阐述', '论述',
         '提出', '作出', '做出', '给出', '给予',
-        # Scoped Intervention (SI)
+    ],
+    'SI': [  # Scoped Intervention (SI)
         '进行', '实行', '实施', '执行', '采取', '开展', '展开',
         '检查', '监督', '管理', '整顿', '治理',
         '帮助', '照顾', '保护', '培训', '治疗', '教育',
         '负责', '负', '要求', '施加', '开放',
         '反抗', '抵抗', '对抗', '攻击',
-        # Directed Action (DA)
+    ],
+    'DA': [  # Directed Action (DA)
         '说', '讲', '喊', '叫', '问', '答', '笑', '骂', '吼', '嚷',
         '说道', '问道', '答道', '喊道', '笑道',
         '点头', '摇头', '挥手', '鞠躬', '微笑',
         '解释', '交代', '表示',
-        # Disposition (DISP)
+    ],
+    'DISP': [  # Disposition (DISP)
         '热情', '冷淡', '冷漠', '友好', '友善', '客气', '礼貌', '恭敬',
         '粗暴', '蛮横', '霸道', '好', '坏', '像', '如同',
         '服从', '顺从', '言听计从', '百依百顺',
-        # Evaluation (EVAL)
+    ],
+    'EVAL': [  # Evaluation (EVAL)
         '有用', '有益', '有害', '有利', '不利', '有效', '无效',
         '重要', '必要', '关键', '危险', '公平', '不公平',
         '造成', '导致', '带来', '产生', '起',
-    ]
+    ],
+}
+
+# Flat list in the same order, for segmentation and prefix matching
+# (added to jieba's dictionary below, and used by the fallback segmenter)
+PREDICATE_WORDS = [word for words in PREDICATES_BY_TYPE.values() for word in words]
+
+# Try to import jieba
+try:
+    import jieba
+    JIEBA_AVAILABLE = True
     
     # Common complements that should NOT be part of predicates
     COMPLEMENTS = [
@@ -81,73 +94,164 @@ try:
         '经济发展', '社会发展', '科学技术',
     ]
     
-    for word in COMMON_NOUNS:
-        jieba.add_word(word, freq=100000)
-    
-    # Add all predicate words with high frequency to force segmentation
-    for word in PREDICATE_WORDS:
-        jieba.add_word(word, freq=100000)
-    
-    # Add complements separately
-    for word in COMPLEMENTS:
-        jieba.add_word(word, freq=90000)
+    # (word, freq) pairs added to jieba's dictionary on first use, in this
+    # order: nouns, then all predicate words with high frequency to force
+    # segmentation, then complements separately
+    _JIEBA_USER_WORDS = (
+        [(word, 100000) for word in COMMON_NOUNS]
+        + [(word, 100000) for word in PREDICATE_WORDS]
+        + [(word, 90000) for word in COMPLEMENTS]
+    )
     
 except ImportError:
     JIEBA_AVAILABLE = False
-    PREDICATE_WORDS = []
+    _JIEBA_USER_WORDS = []
+
+# jieba builds its prefix dictionary on the first add_word, which takes about
+# a second, so the custom words are added when segmentation is first needed
+_jieba_lock = threading.Lock()
+_jieba_ready = False
+
+
+def _ensure_jieba() -> None:
+    """Add the custom words to jieba once (thread-safe)."""
+    global _jieba_ready
+    if _jieba_ready:
+        return
+    with _jieba_lock:
+        if not _jieba_ready:
+            for word, freq in _JIEBA_USER_WORDS:
+                jieba.add_word(word, freq=freq)
+            _jieba_ready = True
 
 
 # Degree adverbs (should be skipped to find the real predicate)
-DEGREE_ADVERBS = {
+DEGREE_ADVERBS = frozenset({
     '很', '非常', '十分', '特别', '比较', '挺', '颇', '极其', 
     '相当', '格外', '更', '更加', '最', '太', '真', '好', '蛮',
     '越来越', '愈来愈', '越发', '尤其', '极', '甚', '颇为',
-}
+})
 
 # Negation words
-NEGATION_WORDS = {'不', '没', '没有', '未', '非', '莫', '勿', '别', '无'}
+NEGATION_WORDS = frozenset({'不', '没', '没有', '未', '非', '莫', '勿', '别', '无'})
 
 # Common nouns - these should NEVER be treated as predicates
-COMMON_NOUNS = {
+COMMON_NOUNS = frozenset({
     '问题', '情况', '现象', '事情', '事件', '结果', '原因',
     '这个', '那个', '这些', '那些', '这件事', '那件事',
     '工作', '学习', '生活', '健康', '经济', '社会', '环境',
     '企业', '公司', '政府', '国家', '世界', '市场',
     '老师', '学生', '朋友', '同事', '领导', '客人',
     '经济发展', '社会发展', '科学技术', '意见', '看法',
-}
+})
+
+# Animacy markers for the Y phrase
+ANIMATE_MARKERS = (
+    '他', '她', '我', '你', '您', '咱', '们', '人', '者', '家', '员',
+    '师', '生', '民', '众', '客', '友', '敌', '方', '孩子', '老人',
+    '同学', '同事', '朋友', '领导', '老师', '学生', '医生', '病人',
+)
+
+INANIMATE_MARKERS = (
+    '此', '这', '那', '事', '件', '问题', '情况', '现象', '结果',
+    '工作', '任务', '项目', '计划', '政策', '法律', '制度',
+    '经济', '社会', '环境', '健康', '身体', '生活', '学习',
+)
+
+# Single-character markers are checked as a set (one pass over the phrase),
+# the multi-character ones with one compiled pattern per class
+_ANIMATE_CHARS = frozenset(m for m in ANIMATE_MARKERS if len(m) == 1)
+_ANIMATE_WORDS = re.compile('|'.join(map(re.escape, (m for m in ANIMATE_MARKERS if len(m) > 1))))
+_INANIMATE_CHARS = frozenset(m for m in INANIMATE_MARKERS if len(m) == 1)
+_INANIMATE_WORDS = re.compile('|'.join(map(re.escape, (m for m in INANIMATE_MARKERS if len(m) > 1))))
 
 # All predicates as a set for quick lookup
 ALL_PREDICATES = set(PREDICATE_WORDS) if PREDICATE_WORDS else set()
 
+# Predicate → construction type it is listed under
+PREDICATE_TYPES: Dict[str, str] = {
+    word: type_code
+    for type_code, words in PREDICATES_BY_TYPE.items()
+    for word in words
+}
+
+
+def _longest_first(words: Iterable[str]) -> Tuple[str, ...]:
+    """
+    Dedupe words (first occurrence wins) and order them longest first.
+    An alternation built from this always prefers the longest match, and
+    equal-length words keep their listed order, so patterns are identical
+    on every run (set order changes with hash randomisation).
+    """
+    return tuple(sorted(dict.fromkeys(words), key=len, reverse=True))
+
+
+# Known words for the fallback segmenter, compiled once at import.
+# The longest known predicate/adverb at a position wins.
+_SEGMENT_WORDS = re.compile(
+    '|'.join(re.escape(w) for w in _longest_first([*PREDICATE_WORDS, *sorted(DEGREE_ADVERBS)]))
+)
+
+# Predicates grouped by first character, longest first within each group
+_PREDICATES_BY_FIRST_CHAR: Dict[str, List[str]] = {}
+for _pred in _longest_first(PREDICATE_WORDS):
+    _PREDICATES_BY_FIRST_CHAR.setdefault(_pred[0], []).append(_pred)
+
+# Predicate prefix patterns for _find_predicate_in_word, compiled once at import.
+# They are keyed on the first character, so a match only tries the few
+# predicates that could fit; being longest-first, a match is always the
+# longest predicate that fits.
+_PREDICATE_PREFIX = {
+    char: re.compile('|'.join(map(re.escape, preds)))
+    for char, preds in _PREDICATES_BY_FIRST_CHAR.items()
+}
+# A predicate followed by more of the word, where the rest isn't a particle
+_PREDICATE_STEM = {
+    char: re.compile(f"(?:{'|'.join(map(re.escape, preds))})(?=[^的地得了着过])")
+    for char, preds in _PREDICATES_BY_FIRST_CHAR.items()
+}
+
+
+class DuiParts(NamedTuple):
+    """Parts of a 对-construction sentence."""
+    before_dui: str = ''
+    y_phrase: str = ''
+    predicate: str = ''
+    after_predicate: str = ''
+    full_after_dui: str = ''
+
 
 def segment_sentence(text: str) -> List[str]:
     """
     Segment Chinese text into words.
     """
+    return list(_segment_cached(text))
+
+
+@functools.lru_cache(maxsize=100000)
+def _segment_cached(text: str) -> Tuple[str, ...]:
+    """
+    Segment each distinct text once. Different sentences often share the text
+    after 对 (我对此…/他对此…), so this is hit even when the sentence is new.
+    """
     if JIEBA_AVAILABLE:
-        return list(jieba.cut(text))
+        _ensure_jieba()
+        return tuple(jieba.cut(text))
     else:
-        return _simple_segment(text)
+        return tuple(_simple_segment(text))
 
 
 def _simple_segment(text: str) -> List[str]:
-    """Simple segmentation fallback."""
+    """Simple segmentation fallback (longest known word, else one character)."""
+    # Let re skip ahead to positions where a known word can start;
+    # everything in between becomes single characters
     result = []
-    i = 0
-    while i < len(text):
-        matched = False
-        for length in range(4, 0, -1):
-            if i + length <= len(text):
-                substr = text[i:i+length]
-                if substr in ALL_PREDICATES or substr in DEGREE_ADVERBS:
-                    result.append(substr)
-                    i += length
-                    matched = True
-                    break
-        if not matched:
-            result.append(text[i])
-            i += 1
+    last_end = 0
+    for match in _SEGMENT_WORDS.finditer(text):
+        result.extend(text[last_end:match.start()])
+        result.append(match.group())
+        last_end = match.end()
+    result.extend(text[last_end:])
     return result
 
 
@@ -158,39 +262,71 @@ def extract_dui_parts(sentence: str) -> Dict[str, str]:
     Returns:
         Dictionary with before_dui, y_phrase, predicate, after_predicate, full_after_dui
     """
-    result = {
-        'before_dui': '',
-        'y_phrase': '',
-        'predicate': '',
-        'after_predicate': '',
-        'full_after_dui': ''
-    }
+    # Fresh dict each call so callers can't mutate the cached result
+    return _cached_dui_parts(sentence)._asdict()
+
+
+def extract_dui_parts_batch(sentences: Iterable[str]) -> List[Dict[str, str]]:
+    """
+    Extract parts of many sentences (e.g. a drill or a corpus file).
     
-    if '对' not in sentence:
-        return result
+    Returns:
+        One dictionary per sentence, as from extract_dui_parts
+    """
+    # Bind the cached extractor once; repeated sentences are cache hits
+    cached = _cached_dui_parts
+    return [cached(sentence)._asdict() for sentence in sentences]
+
+
+def extract_dui_parts_columns(sentences: Iterable[str]) -> Dict[str, List[str]]:
+    """
+    Extract parts of many sentences, column by column.
     
+    Returns:
+        Dictionary mapping each DuiParts field to a list with one entry per
+        sentence (ready for e.g. pandas.DataFrame)
+    """
+    rows = [_cached_dui_parts(sentence) for sentence in sentences]
+    return {
+        field: [row[i] for row in rows]
+        for i, field in enumerate(DuiParts._fields)
+    }
+
+
+# Last characters that mark a fallback word as a person noun, not a predicate
+_PERSON_SUFFIXES = frozenset('人者们')
+
+# Shared result for sentences without 对
+_EMPTY_PARTS = DuiParts()
+
+
+@functools.lru_cache(maxsize=100000)
+def _cached_dui_parts(sentence: str) -> DuiParts:
+    """
+    Extract parts of a sentence once and keep the immutable record.
+    Sentences repeat a lot (reruns, corpus scans), and extraction is pure.
+    """
     # CRITICAL: Split on 对 FIRST, then segment each part
     # This avoids jieba combining 对 with following characters (e.g., 对此)
-    parts = sentence.split('对', 1)
-    result['before_dui'] = parts[0]
-    
-    if len(parts) < 2:
-        return result
+    dui_index = sentence.find('对')
+    if dui_index < 0:
+        return _EMPTY_PARTS
     
-    after_dui = parts[1]
-    result['full_after_dui'] = after_dui
+    after_dui = sentence[dui_index + 1:]
     
     # Now segment the part after 对
-    words = segment_sentence(after_dui)
+    words = _segment_cached(after_dui)
     
     # Extract Y phrase and predicate
     y_phrase, predicate, after_pred = _extract_y_and_predicate(words, after_dui)
     
-    result['y_phrase'] = y_phrase
-    result['predicate'] = predicate
-    result['after_predicate'] = after_pred
-    
-    return result
+    return DuiParts(
+        before_dui=sentence[:dui_index],
+        y_phrase=y_phrase,
+        predicate=predicate,
+        after_predicate=after_pred,
+        full_after_dui=after_dui,
+    )
 
 
 def _find_predicate_in_word(word: str) -> Optional[str]:
@@ -214,39 +350,40 @@ def _find_predicate_in_word(word: str) -> Optional[str]:
     # Check for negation prefix (不/没/未) + predicate
     # E.g., "不感兴趣" → return "不感兴趣" (keep negation)
     if word.startswith(('不', '没', '未')):
-        remainder = word[1:]
-        # Check if remainder is a predicate
-        if remainder in ALL_PREDICATES:
-            return word  # Return with negation: "不感兴趣"
-        # Check if remainder starts with a predicate
-        for pred in sorted(ALL_PREDICATES, key=len, reverse=True):
-            if remainder.startswith(pred):
-                return word[:1] + pred  # Return negation + predicate
+        # Longest predicate at the start of the remainder (or all of it)
+        prefix = _PREDICATE_PREFIX.get(word[1:2])
+        match = prefix.match(word, 1) if prefix else None
+        if match:
+            return word[:1] + match.group()  # Return negation + predicate
     
     # Check if any known predicate is at the START of this word
-    for pred in sorted(ALL_PREDICATES, key=len, reverse=True):  # Longer predicates first
-        if word.startswith(pred) and len(word) > len(pred):
-            # Make sure the remaining part isn't making this a different word
-            remaining = word[len(pred):]
-            # Don't split if this creates a nonsense split
-            if remaining and remaining[0] not in '的地得了着过':
-                # Check if the full word might be a noun
-                if word not in COMMON_NOUNS:
-                    return pred
+    # (longest first, and not directly followed by 的/地/得/了/着/过)
+    stem = _PREDICATE_STEM.get(word[:1])
+    match = stem.match(word) if stem else None
+    if match:
+        return match.group()
     
     return None
 
 
-def _extract_y_and_predicate(words: List[str], original_text: str) -> Tuple[str, str, str]:
+def _extract_y_and_predicate(words: Sequence[str], original_text: str) -> Tuple[str, str, str]:
     """
     Extract Y phrase and predicate from words after 对.
     """
     if not words:
         return '', '', ''
     
-    y_parts = []
+    # The words concatenate back to original_text, so the Y phrase and the text
+    # after the predicate are slices of it at these word start offsets
+    offsets = [0]
+    for w in words:
+        offsets.append(offsets[-1] + len(w))
+    
+    y_end = 0
     predicate = ''
-    after_pred = ''
+    after_start = len(original_text)
+    # Set when the negation look-ahead already found no predicate in words[i]
+    checked_by_lookahead = False
     
     i = 0
     while i < len(words):
@@ -254,7 +391,7 @@ def _extract_y_and_predicate(words: List[str], original_text: str) -> Tuple[str,
         
         # Skip degree adverbs - they precede the predicate
         if word in DEGREE_ADVERBS:
-            y_parts = words[:i]
+            y_end = offsets[i]
             # Look for predicate after adverb
             for j in range(i + 1, len(words)):
                 candidate = words[j]
@@ -262,28 +399,23 @@ def _extract_y_and_predicate(words: List[str], original_text: str) -> Tuple[str,
                 found_pred = _find_predicate_in_word(candidate)
                 if found_pred:
                     predicate = found_pred
-                    # After predicate is the rest
-                    remaining_of_word = candidate[len(found_pred):]
-                    after_parts = [remaining_of_word] if remaining_of_word else []
-                    after_parts.extend(words[j+1:])
-                    after_pred = ''.join(after_parts)
+                    # After predicate is the rest of this word plus following words
+                    after_start = offsets[j] + len(found_pred)
                     break
                 elif candidate not in DEGREE_ADVERBS and candidate not in NEGATION_WORDS:
                     predicate = candidate
-                    after_pred = ''.join(words[j+1:])
+                    after_start = offsets[j + 1]
                     break
             break
         
         # Check if this word IS or CONTAINS a predicate
-        found_pred = _find_predicate_in_word(word)
+        found_pred = None if checked_by_lookahead else _find_predicate_in_word(word)
+        checked_by_lookahead = False
         if found_pred:
-            y_parts = words[:i]
+            y_end = offsets[i]
             predicate = found_pred
             # The rest of this word (if any) plus following words
-            remaining_of_word = word[len(found_pred):]
-            after_parts = [remaining_of_word] if remaining_of_word else []
-            after_parts.extend(words[i+1:])
-            after_pred = ''.join(after_parts)
+            after_start = offsets[i] + len(found_pred)
             break
         
         # Check for negation + predicate pattern
@@ -291,69 +423,81 @@ def _extract_y_and_predicate(words: List[str], original_text: str) -> Tuple[str,
             next_word = words[i + 1]
             found_pred = _find_predicate_in_word(next_word)
             if found_pred:
-                y_parts = words[:i]
+                y_end = offsets[i]
                 predicate = word + found_pred  # Include negation
-                remaining_of_word = next_word[len(found_pred):]
-                after_parts = [remaining_of_word] if remaining_of_word else []
-                after_parts.extend(words[i+2:])
-                after_pred = ''.join(after_parts)
+                after_start = offsets[i + 1] + len(found_pred)
                 break
+            checked_by_lookahead = True
         
         i += 1
     
     # If no predicate found, use fallback
-    if not predicate and words:
+    if not predicate:
         # Try to find any 2-character verb-like word
         for idx, word in enumerate(words):
             if len(word) >= 2 and word not in DEGREE_ADVERBS and word not in {'的', '地', '得'}:
-                if not word.endswith(('人', '者', '们')):
-                    y_parts = words[:idx] if idx > 0 else []
+                if word[-1] not in _PERSON_SUFFIXES:
+                    y_end = offsets[idx]
                     predicate = word
-                    after_pred = ''.join(words[idx+1:])
+                    after_start = offsets[idx + 1]
                     break
     
-    y_phrase = ''.join(y_parts)
-    
-    return y_phrase, predicate, after_pred
+    return original_text[:y_end], predicate, original_text[after_start:]
 
 
 def extract_predicate(sentence: str) -> str:
     """Extract the main predicate from a 对-construction sentence."""
-    parts = extract_dui_parts(sentence)
-    return parts.get('predicate', '')
+    return _cached_dui_parts(sentence).predicate
+
+
+def extract_predicate_with_type(sentence: str) -> Tuple[str, Optional[str]]:
+    """
+    Extract the main predicate and the construction type it is listed under.
+    
+    A negated predicate (e.g. 不重视) takes the type of the bare predicate.
+    The type is None if the predicate is not in the predicate lists (None
+    rather than an 'UNK' code, so it can't be mistaken for a real type).
+
+    Returns:
+        (predicate, type code or None)
+    """
+    predicate = _cached_dui_parts(sentence).predicate
+    type_code = PREDICATE_TYPES.get(predicate)
+    if type_code is None:
+        # Longest negation word first (没有 before 没)
+        for size in (2, 1):
+            if predicate[:size] in NEGATION_WORDS:
+                type_code = PREDICATE_TYPES.get(predicate[size:])
+                if type_code is not None:
+                    break
+    return predicate, type_code
 
 
 def extract_y_phrase(sentence: str) -> str:
     """Extract the Y phrase (object of 对) from a sentence."""
-    parts = extract_dui_parts(sentence)
-    return parts.get('y_phrase', '')
+    return _cached_dui_parts(sentence).y_phrase
 
 
+@functools.lru_cache(maxsize=100000)
 def guess_y_animacy(y_phrase: str) -> str:
     """Guess the animacy of the Y phrase."""
-    animate_markers = [
-        '他', '她', '我', '你', '您', '咱', '们', '人', '者', '家', '员',
-        '师', '生', '民', '众', '客', '友', '敌', '方', '孩子', '老人',
-        '同学', '同事', '朋友', '领导', '老师', '学生', '医生', '病人',
-    ]
+    # Any animate marker wins, even if an inanimate one also appears
+    if not _ANIMATE_CHARS.isdisjoint(y_phrase) or _ANIMATE_WORDS.search(y_phrase):
+        return 'animate'
     
-    inanimate_markers = [
-        '此', '这', '那', '事', '件', '问题', '情况', '现象', '结果',
-        '工作', '任务', '项目', '计划', '政策', '法律', '制度',
-        '经济', '社会', '环境', '健康', '身体', '生活', '学习',
-    ]
-    
-    for marker in animate_markers:
-        if marker in y_phrase:
-            return 'animate'
-    
-    for marker in inanimate_markers:
-        if marker in y_phrase:
-            return 'inanimate'
+    if not _INANIMATE_CHARS.isdisjoint(y_phrase) or _INANIMATE_WORDS.search(y_phrase):
+        return 'inanimate'
     
     return 'unknown'
 
 
+def clear_caches() -> None:
+    """Clear the memoised segmentation, extraction and animacy results (e.g. between tests)."""
+    _segment_cached.cache_clear()
+    _cached_dui_parts.cache_clear()
+    guess_y_animacy.cache_clear()
+
+
 if __name__ == "__main__":
     # Test extraction
     test_sentences = [